@@ -1,6 +1,6 @@
 use std::collections::HashMap;
 use std::fs;
-use std::io::Read;
+use std::io::{BufRead, Read, Write};
 use std::path::PathBuf;
 
 use clap::{Args, Parser, Subcommand};
@@ -58,6 +58,8 @@ enum Command {
     CiExtract(CiExtractArgs),
     /// SQLite database migration and seeding operations.
     Migrate(MigrateArgs),
+    /// Serve parse requests as length-prefixed JSON frames over stdin/stdout.
+    Daemon,
 }
 
 #[derive(Debug, Args)]
@@ -101,6 +103,9 @@ struct ExtractArgs {
     /// Output format for schema and report files (default: json).
     #[arg(long, default_value = "json")]
     format: CliOutputFormat,
+    /// Write the extraction report to stdout instead of `extraction-report.<ext>`.
+    #[arg(long)]
+    stdout_report: bool,
 }
 
 #[derive(Debug, Args)]
@@ -258,6 +263,7 @@ fn main() {
         Command::ParseFile(args) => run_parse_file(args),
         Command::CiExtract(args) => run_ci_extract(args),
         Command::Migrate(args) => run_migrate(args),
+        Command::Daemon => run_daemon(),
     };
 
     if let Err(err) = result {
@@ -334,14 +340,20 @@ fn run_extract(args: ExtractArgs) -> Result<(), String> {
         written += 1;
     }
 
-    println!("Extracted and wrote {written} schema file(s).");
-
     let report_bundle =
         build_report_bundle(PACKAGE_VERSION, outcome.reports, outcome.failures.clone());
-    let report_path = args.output.join(format!("extraction-report.{ext}"));
     let report_raw = format_report_bundle(&report_bundle, format)?;
-    fs::write(&report_path, report_raw)
-        .map_err(|err| format!("Failed to write '{}': {err}", report_path.display()))?;
+
+    // Keep stdout clean for the report when it is streamed there.
+    if args.stdout_report {
+        eprintln!("Extracted and wrote {written} schema file(s).");
+        println!("{report_raw}");
+    } else {
+        println!("Extracted and wrote {written} schema file(s).");
+        let report_path = args.output.join(format!("extraction-report.{ext}"));
+        fs::write(&report_path, report_raw)
+            .map_err(|err| format!("Failed to write '{}': {err}", report_path.display()))?;
+    }
 
     if !outcome.failures.is_empty() {
         let summary = failure_code_summary(&report_bundle.reports);
@@ -440,6 +452,14 @@ fn run_parse_file(args: ParseFileArgs) -> Result<(), String> {
     )
 }
 
+/// Combined schema and report emitted by `--with-report` parse modes.
+#[derive(serde::Serialize)]
+struct ParseOutput {
+    #[serde(skip_serializing_if = "Option::is_none")]
+    schema: Option<command_schema_core::CommandSchema>,
+    report: command_schema_discovery::report::ExtractionReport,
+}
+
 fn run_parse_help_text(
     command: &str,
     help_text: &str,
@@ -455,13 +475,6 @@ fn run_parse_help_text(
             ExtractionQualityPolicy::permissive(),
         );
 
-        #[derive(serde::Serialize)]
-        struct ParseOutput {
-            #[serde(skip_serializing_if = "Option::is_none")]
-            schema: Option<command_schema_core::CommandSchema>,
-            report: command_schema_discovery::report::ExtractionReport,
-        }
-
         let output = ParseOutput {
             schema: run.result.schema.clone(),
             report: run.report.clone(),
@@ -504,6 +517,128 @@ fn run_parse_help_text(
     Ok(())
 }
 
+// ---------------------------------------------------------------------------
+// daemon command
+// ---------------------------------------------------------------------------
+
+/// One parse request read from the daemon's stdin.
+///
+/// Exactly one of `help_text` or `input` should be set; `help_text` wins if
+/// both are present.
+#[derive(Debug, serde::Deserialize)]
+struct DaemonRequest {
+    command: String,
+    #[serde(default)]
+    help_text: Option<String>,
+    #[serde(default)]
+    input: Option<PathBuf>,
+    #[serde(default)]
+    with_report: bool,
+}
+
+/// Largest request body the daemon accepts, so a corrupt header cannot make
+/// it allocate an arbitrary amount of memory.
+const MAX_DAEMON_FRAME_LEN: usize = 64 * 1024 * 1024;
+
+/// Serves parse requests until stdin is closed.
+///
+/// Each request frame is a decimal byte length on its own line, followed by
+/// that many bytes of JSON and a trailing newline. Replies carry their status
+/// in the header line, `ok <len>` or `err <len>`, followed by the body and a
+/// newline. An `ok` body is the bare result JSON, exactly as `parse-stdin`
+/// would print it, so clients can decode it without unwrapping; an `err`
+/// body is the UTF-8 error message. Per-request failures are reported
+/// in-band; only framing and I/O errors terminate the daemon.
+fn run_daemon() -> Result<(), String> {
+    let stdin = std::io::stdin();
+    let mut reader = stdin.lock();
+    let stdout = std::io::stdout();
+    let mut writer = stdout.lock();
+    let mut header = String::new();
+
+    loop {
+        header.clear();
+        let read = reader
+            .read_line(&mut header)
+            .map_err(|err| format!("Failed to read frame header: {err}"))?;
+        if read == 0 {
+            return Ok(());
+        }
+        let len: usize = header
+            .trim()
+            .parse()
+            .map_err(|err| format!("Invalid frame header '{}': {err}", header.trim()))?;
+        if len > MAX_DAEMON_FRAME_LEN {
+            return Err(format!(
+                "Frame length {len} exceeds the {MAX_DAEMON_FRAME_LEN} byte limit"
+            ));
+        }
+
+        let mut body = vec![0u8; len];
+        reader
+            .read_exact(&mut body)
+            .map_err(|err| format!("Failed to read frame body: {err}"))?;
+        let mut terminator = [0u8; 1];
+        reader
+            .read_exact(&mut terminator)
+            .map_err(|err| format!("Failed to read frame terminator: {err}"))?;
+        if terminator[0] != b'\n' {
+            return Err(format!(
+                "Invalid frame terminator {:?}, expected '\\n'",
+                char::from(terminator[0])
+            ));
+        }
+
+        let reply = serde_json::from_slice::<DaemonRequest>(&body)
+            .map_err(|err| format!("Invalid request: {err}"))
+            .and_then(handle_daemon_request);
+        let (status, raw) = match reply {
+            Ok(result) => ("ok", result),
+            Err(error) => ("err", error.into_bytes()),
+        };
+
+        writeln!(writer, "{status} {}", raw.len())
+            .and_then(|()| writer.write_all(&raw))
+            .and_then(|()| writer.write_all(b"\n"))
+            .and_then(|()| writer.flush())
+            .map_err(|err| format!("Failed to write reply: {err}"))?;
+    }
+}
+
+fn handle_daemon_request(request: DaemonRequest) -> Result<Vec<u8>, String> {
+    let help_text = match (request.help_text, request.input) {
+        (Some(help_text), _) => help_text,
+        (None, Some(input)) => fs::read_to_string(&input)
+            .map_err(|err| format!("Failed to read '{}': {err}", input.display()))?,
+        (None, None) => return Err("Request must include 'help_text' or 'input'".to_string()),
+    };
+
+    if request.with_report {
+        let run = command_schema_discovery::parse_help_text_with_report(
+            &request.command,
+            &help_text,
+            ExtractionQualityPolicy::permissive(),
+        );
+        let output = ParseOutput {
+            schema: run.result.schema,
+            report: run.report,
+        };
+        serde_json::to_vec(&output).map_err(|e| format!("Failed to serialize output: {e}"))
+    } else {
+        let result = command_schema_discovery::parse_help_text(&request.command, &help_text);
+        match result.schema {
+            Some(schema) => {
+                serde_json::to_vec(&schema).map_err(|e| format!("Failed to serialize output: {e}"))
+            }
+            None => Err(format!(
+                "Failed to parse help text for '{}': {}",
+                request.command,
+                result.warnings.join("; ")
+            )),
+        }
+    }
+}
+
 // ---------------------------------------------------------------------------
 // ci-extract command
 // ---------------------------------------------------------------------------
@@ -232,6 +232,116 @@ fn test_parse_stdin_with_report_yaml() {
     );
 }
 
+// ---- daemon tests ----
+
+fn daemon_frame(request: &serde_json::Value) -> Vec<u8> {
+    let body = serde_json::to_vec(request).unwrap();
+    let mut frame = format!("{}\n", body.len()).into_bytes();
+    frame.extend_from_slice(&body);
+    frame.push(b'\n');
+    frame
+}
+
+/// Splits daemon stdout into `(status, body)` reply frames.
+fn daemon_replies(stdout: &[u8]) -> Vec<(String, Vec<u8>)> {
+    let mut replies = Vec::new();
+    let mut rest = stdout;
+    while !rest.is_empty() {
+        let newline = rest.iter().position(|&b| b == b'\n').expect("frame header");
+        let header = std::str::from_utf8(&rest[..newline]).unwrap();
+        let (status, len) = header.split_once(' ').expect("status and length");
+        let len: usize = len.parse().expect("numeric frame length");
+        let body = &rest[newline + 1..newline + 1 + len];
+        replies.push((status.to_string(), body.to_vec()));
+        assert_eq!(rest[newline + 1 + len], b'\n', "frame terminator");
+        rest = &rest[newline + 2 + len..];
+    }
+    replies
+}
+
+#[test]
+fn test_daemon_serves_multiple_requests() {
+    let bin = schema_discover_bin();
+    let help_text =
+        fs::read_to_string(fixture("git-help.txt")).expect("fixture should be readable");
+
+    let mut child = Command::new(&bin)
+        .arg("daemon")
+        .stdin(std::process::Stdio::piped())
+        .stdout(std::process::Stdio::piped())
+        .stderr(std::process::Stdio::piped())
+        .spawn()
+        .expect("failed to spawn schema-discover");
+
+    {
+        use std::io::Write;
+        let stdin = child.stdin.as_mut().unwrap();
+        stdin
+            .write_all(&daemon_frame(
+                &serde_json::json!({ "command": "git", "help_text": help_text }),
+            ))
+            .unwrap();
+        stdin
+            .write_all(&daemon_frame(&serde_json::json!({
+                "command": "ls",
+                "input": fixture("ls-help.txt"),
+                "with_report": true,
+            })))
+            .unwrap();
+        stdin
+            .write_all(&daemon_frame(&serde_json::json!({ "command": "missing" })))
+            .unwrap();
+    }
+
+    let output = child.wait_with_output().expect("failed to wait");
+    assert!(
+        output.status.success(),
+        "daemon failed: {}",
+        String::from_utf8_lossy(&output.stderr)
+    );
+
+    let replies = daemon_replies(&output.stdout);
+    assert_eq!(replies.len(), 3);
+
+    assert_eq!(replies[0].0, "ok");
+    let schema: serde_json::Value =
+        serde_json::from_slice(&replies[0].1).expect("ok body should be the schema JSON");
+    assert_eq!(schema["command"], "git");
+
+    assert_eq!(replies[1].0, "ok");
+    let parsed: serde_json::Value =
+        serde_json::from_slice(&replies[1].1).expect("ok body should be the parse output JSON");
+    assert_eq!(parsed["report"]["command"], "ls");
+
+    assert_eq!(replies[2].0, "err");
+    assert!(!replies[2].1.is_empty(), "err body should carry a message");
+}
+
+#[test]
+fn test_daemon_rejects_malformed_frames() {
+    let bin = schema_discover_bin();
+    let bad_terminator = b"2\n{}X".to_vec();
+    let oversized = format!("{}\n", u64::MAX).into_bytes();
+
+    for input in [bad_terminator, oversized] {
+        let mut child = Command::new(&bin)
+            .arg("daemon")
+            .stdin(std::process::Stdio::piped())
+            .stdout(std::process::Stdio::piped())
+            .stderr(std::process::Stdio::piped())
+            .spawn()
+            .expect("failed to spawn schema-discover");
+        {
+            use std::io::Write;
+            child.stdin.as_mut().unwrap().write_all(&input).unwrap();
+        }
+
+        let output = child.wait_with_output().expect("failed to wait");
+        assert!(!output.status.success(), "daemon should reject the frame");
+        assert!(output.stdout.is_empty(), "no reply for a malformed frame");
+    }
+}
+
 // ---- library-level integration tests ----
 
 #[test]
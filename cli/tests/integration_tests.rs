@@ -71,6 +71,42 @@ fn write_test_schema(dir: &TempDir, command: &str) -> PathBuf {
     path
 }
 
+// ---------------------------------------------------------------------------
+// Extract tests
+// ---------------------------------------------------------------------------
+
+#[test]
+fn extract_stdout_report_skips_report_file() {
+    let output = TempDir::new("extract_stdout_report_out");
+
+    let result = std::process::Command::new(env!("CARGO_BIN_EXE_schema-discover"))
+        .args([
+            "extract",
+            "--commands",
+            "echo",
+            "--no-cache",
+            "--stdout-report",
+            "--output",
+            output.path().to_str().unwrap(),
+        ])
+        .output()
+        .expect("failed to run schema-discover");
+
+    assert!(
+        result.status.success(),
+        "extract --stdout-report should succeed: {}",
+        String::from_utf8_lossy(&result.stderr)
+    );
+    let bundle: serde_json::Value =
+        serde_json::from_slice(&result.stdout).expect("stdout should be the report JSON");
+    assert!(bundle["reports"].is_array());
+    assert!(bundle["failures"].is_array());
+    assert!(
+        !output.join("extraction-report.json").exists(),
+        "report file should not be written in stdout mode"
+    );
+}
+
 // ---------------------------------------------------------------------------
 // CI Extract tests
 // ---------------------------------------------------------------------------
@@ -8,9 +8,12 @@ from command_schema_discovery.types import (
     FailureCode,
     FlagSchema,
     FormatScoreReport,
+    LazyCommandSchema,
+    LazyExtractionReport,
     ProbeAttemptReport,
     QualityTier,
     SubcommandSchema,
+    ValueType,
 )
 
 __all__ = [
@@ -20,8 +23,11 @@ __all__ = [
     "FailureCode",
     "FlagSchema",
     "FormatScoreReport",
+    "LazyCommandSchema",
+    "LazyExtractionReport",
     "ProbeAttemptReport",
     "QualityTier",
     "SchemaDiscovery",
     "SubcommandSchema",
+    "ValueType",
 ]
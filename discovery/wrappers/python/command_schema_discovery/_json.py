@@ -0,0 +1,15 @@
+"""JSON decoding backends shared by the client and the type decoders."""
+
+try:
+    from orjson import loads
+except ImportError:  # orjson is an optional speedup
+    from json import loads
+
+try:
+    from msgspec import DecodeError
+    from msgspec.json import Decoder
+except ImportError:  # msgspec is an optional speedup
+    DecodeError = None
+    Decoder = None
+
+__all__ = ["DecodeError", "Decoder", "loads"]
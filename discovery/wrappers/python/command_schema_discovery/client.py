@@ -2,11 +2,24 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
+import os
+import shutil
 import subprocess
-from typing import Any, Dict, List, Optional
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from types import TracebackType
+from typing import Any, Dict, List, Optional, Tuple, Type
 
-from command_schema_discovery.types import CommandSchema, ExtractionReport
+from command_schema_discovery._json import loads as _json_loads
+from command_schema_discovery.types import (
+    CommandSchema,
+    ExtractionReport,
+    LazyCommandSchema,
+    LazyExtractionReport,
+)
 
 
 class SchemaDiscoveryError(Exception):
@@ -14,11 +27,111 @@ class SchemaDiscoveryError(Exception):
 
 
 class SchemaDiscovery:
-    """Thin wrapper around the schema-discover binary."""
+    """Thin wrapper around the schema-discover binary.
 
-    def __init__(self, cli_path: str = "schema-discover"):
+    Used as a context manager, the parse methods are served by a single
+    long-lived ``schema-discover daemon`` process instead of spawning the CLI
+    once per call. If the daemon dies or a reply frame is corrupted, that call
+    fails and later calls fall back to one-shot subprocesses. ``cli_path``
+    cannot be reassigned while the daemon is running.
+
+    With ``fast_spawn=True`` the CLI is spawned with ``close_fds=False``,
+    skipping the scan that closes every inherited descriptor in the child.
+    Descriptors opened by Python are non-inheritable by default, so this is
+    safe unless the caller has explicitly made descriptors inheritable.
+    Because ``cli_path`` is resolved against ``PATH`` once up front, this also
+    lets CPython launch the CLI with ``posix_spawn`` instead of fork+exec.
+
+    ``parse_stdin`` output is memoized per (command, help text digest) in an
+    LRU cache of ``cache_size`` entries; ``cache_size=0`` disables it. The
+    cache holds the raw CLI JSON, so every call returns a fresh schema.
+    """
+
+    def __init__(
+        self,
+        cli_path: str = "schema-discover",
+        *,
+        fast_spawn: bool = False,
+        cache_size: int = 1024,
+    ):
+        self.fast_spawn = fast_spawn
+        self.cache_size = cache_size
+        self._parse_cache: "OrderedDict[Tuple[str, bytes], bytes]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._daemon: Optional[subprocess.Popen] = None
+        self._daemon_lock = threading.Lock()
         self.cli_path = cli_path
 
+    @property
+    def cli_path(self) -> str:
+        return self._cli_path
+
+    @cli_path.setter
+    def cli_path(self, cli_path: str) -> None:
+        if self._daemon is not None:
+            # The daemon keeps serving from the binary it was started with.
+            raise SchemaDiscoveryError(
+                "Cannot change cli_path while the daemon is running"
+            )
+        self._cli_path = shutil.which(cli_path) or cli_path
+        # Fixed argv prefixes; each call only appends its variable arguments.
+        self._parse_stdin_argv = (self._cli_path, "parse-stdin", "--format", "json")
+        self._parse_file_argv = (self._cli_path, "parse-file", "--format", "json")
+        self._parse_report_argv = (*self._parse_stdin_argv, "--with-report")
+        # Output cached from the previous binary no longer applies.
+        with self._cache_lock:
+            self._parse_cache.clear()
+
+    def __enter__(self) -> "SchemaDiscovery":
+        if self._daemon is None:
+            self._daemon = subprocess.Popen(
+                [self.cli_path, "daemon"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                close_fds=not self.fast_spawn,
+            )
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Stop the daemon process, if one is running."""
+        with self._daemon_lock:
+            proc, self._daemon = self._daemon, None
+            if proc is None:
+                return
+            try:
+                proc.stdin.close()
+            except OSError:
+                pass
+            try:
+                proc.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+                proc.wait()
+            proc.stdout.close()
+
+    def _discard_daemon(self, proc: subprocess.Popen) -> None:
+        """Kill a daemon whose pipe can no longer be trusted.
+
+        Must be called with ``_daemon_lock`` held. Later calls fall back to
+        the one-shot subprocess path.
+        """
+        self._daemon = None
+        proc.kill()
+        proc.wait()
+        for pipe in (proc.stdin, proc.stdout):
+            try:
+                pipe.close()
+            except OSError:
+                pass
+
     def extract(
         self,
         commands: List[str],
@@ -28,8 +141,110 @@ class SchemaDiscovery:
         min_confidence: Optional[float] = None,
         min_coverage: Optional[float] = None,
         jobs: Optional[int] = None,
+        write_report: bool = False,
+    ) -> Dict[str, Any]:
+        """Extract schemas for the given commands.
+
+        The report is read from the CLI's stdout. Pass ``write_report=True``
+        to have it written to ``extraction-report.json`` in *output* instead.
+        """
+        return self._run_extract(
+            commands,
+            output,
+            installed_only=installed_only,
+            min_confidence=min_confidence,
+            min_coverage=min_coverage,
+            jobs=jobs,
+            write_report=write_report,
+        )
+
+    def extract_many(
+        self,
+        command_batches: List[List[str]],
+        output: str = "/tmp/schema-output",
+        *,
+        installed_only: bool = False,
+        min_confidence: Optional[float] = None,
+        min_coverage: Optional[float] = None,
+        jobs: Optional[int] = None,
+        write_report: bool = False,
+    ) -> Dict[str, Dict[str, Any]]:
+        """Extract schemas for several command groups in one CLI invocation.
+
+        Returns the per-command extraction reports keyed by command name.
+        """
+        commands: List[str] = []
+        seen = set()
+        for batch in command_batches:
+            for command in batch:
+                if command not in seen:
+                    seen.add(command)
+                    commands.append(command)
+        if not commands:
+            return {}
+
+        bundle = self._run_extract(
+            commands,
+            output,
+            installed_only=installed_only,
+            min_confidence=min_confidence,
+            min_coverage=min_coverage,
+            jobs=jobs,
+            write_report=write_report,
+        )
+        return {report["command"]: report for report in bundle.get("reports", [])}
+
+    def extract_parallel(
+        self,
+        commands: List[str],
+        output: str = "/tmp/schema-output",
+        *,
+        max_workers: Optional[int] = None,
+        installed_only: bool = False,
+        min_confidence: Optional[float] = None,
+        min_coverage: Optional[float] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """Extract each command in its own CLI process, several at a time.
+
+        Returns the per-command extraction reports keyed by command name.
+        *max_workers* defaults to the CPU count; each CLI process runs with a
+        single job so the workers do not oversubscribe the machine.
+        """
+        commands = list(dict.fromkeys(commands))
+        if not commands:
+            return {}
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+
+        def extract_one(command: str) -> Dict[str, Any]:
+            return self._run_extract(
+                [command],
+                output,
+                installed_only=installed_only,
+                min_confidence=min_confidence,
+                min_coverage=min_coverage,
+                jobs=1,
+                write_report=False,
+            )
+
+        reports: Dict[str, Dict[str, Any]] = {}
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(commands))) as pool:
+            for bundle in pool.map(extract_one, commands):
+                for report in bundle.get("reports", []):
+                    reports[report["command"]] = report
+        return reports
+
+    def _run_extract(
+        self,
+        commands: List[str],
+        output: str,
+        *,
+        installed_only: bool,
+        min_confidence: Optional[float],
+        min_coverage: Optional[float],
+        jobs: Optional[int],
+        write_report: bool,
     ) -> Dict[str, Any]:
-        """Extract schemas for the given commands."""
         args = [
             self.cli_path,
             "extract",
@@ -47,86 +262,160 @@ class SchemaDiscovery:
         if jobs is not None:
             args.extend(["--jobs", str(jobs)])
 
-        result = subprocess.run(args, capture_output=True, text=True)
-        if result.returncode != 0:
-            raise SchemaDiscoveryError(result.stderr.strip())
+        if not write_report:
+            args.append("--stdout-report")
+
+        # In file mode stdout only carries progress chatter.
+        stdout = self._run_cli(args, capture_stdout=not write_report)
 
-        report_path = f"{output}/extraction-report.json"
         try:
-            with open(report_path) as f:
-                return json.load(f)
+            if not write_report:
+                return _json_loads(stdout)
+            with open(f"{output}/extraction-report.json", "rb") as f:
+                return _json_loads(f.read())
         except (FileNotFoundError, json.JSONDecodeError) as e:
             raise SchemaDiscoveryError(f"Failed to read report: {e}") from e
 
     def parse_stdin(self, command: str, help_text: str) -> CommandSchema:
         """Parse help text without executing the command."""
-        args = [
-            self.cli_path,
-            "parse-stdin",
-            "--command",
-            command,
-            "--format",
-            "json",
-        ]
-        result = subprocess.run(
-            args,
-            input=help_text,
-            capture_output=True,
-            text=True,
-        )
-        if result.returncode != 0:
-            raise SchemaDiscoveryError(result.stderr.strip())
+        raw = help_text.encode("utf-8")
+        use_cache = self.cache_size > 0
+        if use_cache:
+            key = (command, hashlib.blake2b(raw, digest_size=16).digest())
+            with self._cache_lock:
+                cached = self._parse_cache.get(key)
+                if cached is not None:
+                    self._parse_cache.move_to_end(key)
+            if cached is not None:
+                return CommandSchema.from_json(cached)
+
+        output = self._daemon_request({"command": command, "help_text": help_text})
+        if output is None:
+            args = [*self._parse_stdin_argv, "--command", command]
+            output = self._run_cli(args, raw)
 
-        data = json.loads(result.stdout)
-        return CommandSchema.from_dict(data)
+        if use_cache:
+            with self._cache_lock:
+                self._parse_cache[key] = output
+                self._parse_cache.move_to_end(key)
+                while len(self._parse_cache) > self.cache_size:
+                    self._parse_cache.popitem(last=False)
+        return CommandSchema.from_json(output)
 
     def parse_file(self, command: str, input_path: str) -> CommandSchema:
         """Parse help text from a file."""
-        args = [
-            self.cli_path,
-            "parse-file",
-            "--command",
-            command,
-            "--input",
-            input_path,
-            "--format",
-            "json",
-        ]
-        result = subprocess.run(args, capture_output=True, text=True)
-        if result.returncode != 0:
-            raise SchemaDiscoveryError(result.stderr.strip())
-
-        data = json.loads(result.stdout)
-        return CommandSchema.from_dict(data)
+        # The daemon resolves relative paths against its own cwd.
+        output = self._daemon_request(
+            {"command": command, "input": os.path.abspath(input_path)}
+        )
+        if output is None:
+            args = [
+                *self._parse_file_argv,
+                "--command",
+                command,
+                "--input",
+                input_path,
+            ]
+            output = self._run_cli(args)
+        return CommandSchema.from_json(output)
 
     def parse_stdin_with_report(
-        self, command: str, help_text: str
+        self, command: str, help_text: str, *, eager: bool = False
     ) -> Dict[str, Any]:
-        """Parse help text and return both schema and report."""
-        args = [
-            self.cli_path,
-            "parse-stdin",
-            "--command",
-            command,
-            "--with-report",
-            "--format",
-            "json",
-        ]
+        """Parse help text and return both schema and report.
+
+        The schema and report are returned as :class:`LazyCommandSchema` and
+        :class:`LazyExtractionReport` views that only build the fields a
+        caller reads. Pass ``eager=True`` to get the full dataclasses.
+        """
+        output = self._daemon_request(
+            {"command": command, "help_text": help_text, "with_report": True}
+        )
+        if output is None:
+            args = [*self._parse_report_argv, "--command", command]
+            output = self._run_cli(args, help_text.encode("utf-8"))
+        return self._parse_result(_json_loads(output), eager)
+
+    def _run_cli(
+        self,
+        args: List[str],
+        stdin: Optional[bytes] = None,
+        *,
+        capture_stdout: bool = True,
+    ) -> bytes:
+        """Run the CLI once and return its raw stdout.
+
+        With ``capture_stdout=False`` stdout is discarded and ``b""`` returned.
+        """
         result = subprocess.run(
             args,
-            input=help_text,
-            capture_output=True,
-            text=True,
+            input=stdin,
+            stdout=subprocess.PIPE if capture_stdout else subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            close_fds=not self.fast_spawn,
         )
         if result.returncode != 0:
-            raise SchemaDiscoveryError(result.stderr.strip())
+            raise SchemaDiscoveryError(
+                result.stderr.decode("utf-8", "replace").strip()
+            )
+        return result.stdout or b""
 
-        data = json.loads(result.stdout)
+    @staticmethod
+    def _parse_result(data: Dict[str, Any], eager: bool) -> Dict[str, Any]:
+        if eager:
+            return {
+                "schema": (
+                    CommandSchema.from_dict(data["schema"])
+                    if data.get("schema")
+                    else None
+                ),
+                "report": ExtractionReport.from_dict(data["report"]),
+            }
         return {
             "schema": (
-                CommandSchema.from_dict(data["schema"])
-                if data.get("schema")
-                else None
+                LazyCommandSchema(data["schema"]) if data.get("schema") else None
             ),
-            "report": ExtractionReport.from_dict(data["report"]),
+            "report": LazyExtractionReport(data["report"]),
         }
+
+    def _daemon_request(self, request: Dict[str, Any]) -> Optional[bytes]:
+        """Send one length-prefixed JSON frame and return the raw result.
+
+        Replies are framed as ``ok <len>`` or ``err <len>``; an ``ok`` body is
+        the same JSON the one-shot CLI prints. Returns ``None`` when no daemon
+        is running so callers fall back to :meth:`_run_cli`.
+        """
+        if self._daemon is None:
+            return None
+        body = json.dumps(request).encode("utf-8")
+        with self._daemon_lock:
+            # Re-check: another thread may have discarded the daemon.
+            proc = self._daemon
+            if proc is None:
+                return None
+            try:
+                proc.stdin.write(b"%d\n" % len(body) + body + b"\n")
+                proc.stdin.flush()
+                header = proc.stdout.readline()
+                if not header:
+                    self._discard_daemon(proc)
+                    raise SchemaDiscoveryError("Daemon exited unexpectedly")
+                status, _, size_text = header.partition(b" ")
+                if status not in (b"ok", b"err"):
+                    raise ValueError(f"unknown reply status {status!r}")
+                size = int(size_text)
+                payload = proc.stdout.read(size)
+                if len(payload) != size or proc.stdout.read(1) != b"\n":
+                    raise OSError("truncated reply frame")
+            except BaseException as e:
+                # Any partial exchange leaves the pipe out of step with the
+                # daemon, so the process cannot serve further requests.
+                if self._daemon is proc:
+                    self._discard_daemon(proc)
+                if isinstance(e, (OSError, ValueError)):
+                    raise SchemaDiscoveryError(f"Daemon I/O failed: {e}") from e
+                raise
+
+        if status == b"err":
+            raise SchemaDiscoveryError(payload.decode("utf-8", "replace"))
+        return payload
@@ -2,12 +2,66 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+import sys
+from dataclasses import MISSING, Field, dataclass, field, fields
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    ForwardRef,
+    List,
+    Literal,
+    Optional,
+    Union,
+    get_args,
+    get_origin,
+    get_type_hints,
+)
 
+from command_schema_discovery._json import DecodeError as _TypedDecodeError
+from command_schema_discovery._json import Decoder as _TypedDecoder
+from command_schema_discovery._json import loads as _json_loads
 
-class FailureCode(str, Enum):
+# Slotted dataclasses (no per-instance ``__dict__``) need Python 3.10+.
+_DATACLASS_OPTIONS: Dict[str, Any] = (
+    {"slots": True} if sys.version_info >= (3, 10) else {}
+)
+# Report leaf records are never mutated after decoding. Schema flags and
+# arguments stay mutable: a frozen ``__init__`` sets every field through
+# ``object.__setattr__``, which roughly doubles decode time for large schemas.
+_FROZEN_DATACLASS_OPTIONS: Dict[str, Any] = {**_DATACLASS_OPTIONS, "frozen": True}
+
+# Serialized Rust ``ValueType``: a unit variant name, or ``{"Choice": [...]}``.
+# Variant names are interned when decoded, so they can be compared by identity.
+ValueType = Union[
+    Literal[
+        "Bool",
+        "String",
+        "Number",
+        "File",
+        "Directory",
+        "Url",
+        "Branch",
+        "Remote",
+        "Any",
+    ],
+    Dict[str, List[str]],
+]
+
+if sys.version_info >= (3, 11):
+    from enum import StrEnum as _StrEnum
+else:
+
+    class _StrEnum(str, Enum):
+        """Stand-in for ``enum.StrEnum`` on Python < 3.11."""
+
+        __str__ = str.__str__
+        __format__ = str.__format__
+
+
+class FailureCode(_StrEnum):
     NOT_INSTALLED = "not_installed"
     PERMISSION_BLOCKED = "permission_blocked"
     TIMEOUT = "timeout"
@@ -16,58 +70,48 @@ class FailureCode(str, Enum):
     QUALITY_REJECTED = "quality_rejected"
 
 
-class QualityTier(str, Enum):
+class QualityTier(_StrEnum):
     HIGH = "high"
     MEDIUM = "medium"
     LOW = "low"
     FAILED = "failed"
 
 
-@dataclass
+# Value -> member tables for the enums decoded by ``from_dict``. A dict hit is
+# much cheaper than ``Enum.__call__``; unknown values still fall through to
+# the enum constructor so they raise ``ValueError`` as before.
+_FAILURE_CODES: Dict[str, FailureCode] = {m.value: m for m in FailureCode}
+_QUALITY_TIERS: Dict[str, QualityTier] = {m.value: m for m in QualityTier}
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class FlagSchema:
     short: Optional[str] = None
     long: Optional[str] = None
-    value_type: Any = "Any"
+    value_type: ValueType = "Any"
     takes_value: bool = False
     description: Optional[str] = None
     multiple: bool = False
     conflicts_with: List[str] = field(default_factory=list)
     requires: List[str] = field(default_factory=list)
 
-    @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "FlagSchema":
-        return cls(
-            short=data.get("short"),
-            long=data.get("long"),
-            value_type=data.get("value_type", "Any"),
-            takes_value=data.get("takes_value", False),
-            description=data.get("description"),
-            multiple=data.get("multiple", False),
-            conflicts_with=data.get("conflicts_with", []),
-            requires=data.get("requires", []),
-        )
+    from_dict: ClassVar[Callable[[Dict[str, Any]], "FlagSchema"]]
+    from_json: ClassVar[Callable[[Union[bytes, str]], "FlagSchema"]]
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class ArgSchema:
     name: str = ""
-    value_type: Any = "Any"
+    value_type: ValueType = "Any"
     required: bool = False
     multiple: bool = False
     description: Optional[str] = None
 
-    @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "ArgSchema":
-        return cls(
-            name=data.get("name", ""),
-            value_type=data.get("value_type", "Any"),
-            required=data.get("required", False),
-            multiple=data.get("multiple", False),
-            description=data.get("description"),
-        )
+    from_dict: ClassVar[Callable[[Dict[str, Any]], "ArgSchema"]]
+    from_json: ClassVar[Callable[[Union[bytes, str]], "ArgSchema"]]
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class SubcommandSchema:
     name: str = ""
     description: Optional[str] = None
@@ -76,21 +120,11 @@ class SubcommandSchema:
     subcommands: List["SubcommandSchema"] = field(default_factory=list)
     aliases: List[str] = field(default_factory=list)
 
-    @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "SubcommandSchema":
-        return cls(
-            name=data.get("name", ""),
-            description=data.get("description"),
-            flags=[FlagSchema.from_dict(f) for f in data.get("flags", [])],
-            positional=[ArgSchema.from_dict(a) for a in data.get("positional", [])],
-            subcommands=[
-                SubcommandSchema.from_dict(s) for s in data.get("subcommands", [])
-            ],
-            aliases=data.get("aliases", []),
-        )
+    from_dict: ClassVar[Callable[[Dict[str, Any]], "SubcommandSchema"]]
+    from_json: ClassVar[Callable[[Union[bytes, str]], "SubcommandSchema"]]
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class CommandSchema:
     command: str = ""
     description: Optional[str] = None
@@ -101,38 +135,20 @@ class CommandSchema:
     confidence: float = 0.0
     version: Optional[str] = None
 
-    @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "CommandSchema":
-        return cls(
-            command=data.get("command", ""),
-            description=data.get("description"),
-            global_flags=[
-                FlagSchema.from_dict(f) for f in data.get("global_flags", [])
-            ],
-            subcommands=[
-                SubcommandSchema.from_dict(s) for s in data.get("subcommands", [])
-            ],
-            positional=[ArgSchema.from_dict(a) for a in data.get("positional", [])],
-            source=data.get("source", "HelpCommand"),
-            confidence=data.get("confidence", 0.0),
-            version=data.get("version"),
-        )
+    from_dict: ClassVar[Callable[[Dict[str, Any]], "CommandSchema"]]
+    from_json: ClassVar[Callable[[Union[bytes, str]], "CommandSchema"]]
 
 
-@dataclass
+@dataclass(**_FROZEN_DATACLASS_OPTIONS)
 class FormatScoreReport:
     format: str = ""
     score: float = 0.0
 
-    @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "FormatScoreReport":
-        return cls(
-            format=data.get("format", ""),
-            score=data.get("score", 0.0),
-        )
+    from_dict: ClassVar[Callable[[Dict[str, Any]], "FormatScoreReport"]]
+    from_json: ClassVar[Callable[[Union[bytes, str]], "FormatScoreReport"]]
 
 
-@dataclass
+@dataclass(**_FROZEN_DATACLASS_OPTIONS)
 class ProbeAttemptReport:
     help_flag: str = ""
     argv: List[str] = field(default_factory=list)
@@ -145,23 +161,11 @@ class ProbeAttemptReport:
     output_preview: Optional[str] = None
     accepted: bool = False
 
-    @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "ProbeAttemptReport":
-        return cls(
-            help_flag=data.get("help_flag", ""),
-            argv=data.get("argv", []),
-            exit_code=data.get("exit_code"),
-            timed_out=data.get("timed_out", False),
-            error=data.get("error"),
-            rejection_reason=data.get("rejection_reason"),
-            output_source=data.get("output_source"),
-            output_len=data.get("output_len", 0),
-            output_preview=data.get("output_preview"),
-            accepted=data.get("accepted", False),
-        )
+    from_dict: ClassVar[Callable[[Dict[str, Any]], "ProbeAttemptReport"]]
+    from_json: ClassVar[Callable[[Union[bytes, str]], "ProbeAttemptReport"]]
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class ExtractionReport:
     command: str = ""
     resolved_executable_path: Optional[str] = None
@@ -184,34 +188,161 @@ class ExtractionReport:
     warnings: List[str] = field(default_factory=list)
     validation_errors: List[str] = field(default_factory=list)
 
-    @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "ExtractionReport":
-        tier = data.get("quality_tier")
-        fc = data.get("failure_code")
-        return cls(
-            command=data.get("command", ""),
-            resolved_executable_path=data.get("resolved_executable_path"),
-            resolved_implementation=data.get("resolved_implementation"),
-            success=data.get("success", False),
-            accepted_for_suggestions=data.get("accepted_for_suggestions", False),
-            quality_tier=QualityTier(tier) if tier else None,
-            quality_reasons=data.get("quality_reasons", []),
-            failure_code=FailureCode(fc) if fc else None,
-            failure_detail=data.get("failure_detail"),
-            selected_format=data.get("selected_format"),
-            format_scores=[
-                FormatScoreReport.from_dict(f) for f in data.get("format_scores", [])
-            ],
-            parsers_used=data.get("parsers_used", []),
-            confidence=data.get("confidence", 0.0),
-            coverage=data.get("coverage", 0.0),
-            relevant_lines=data.get("relevant_lines", 0),
-            recognized_lines=data.get("recognized_lines", 0),
-            unresolved_lines=data.get("unresolved_lines", []),
-            probe_attempts=[
-                ProbeAttemptReport.from_dict(p)
-                for p in data.get("probe_attempts", [])
-            ],
-            warnings=data.get("warnings", []),
-            validation_errors=data.get("validation_errors", []),
+    from_dict: ClassVar[Callable[[Dict[str, Any]], "ExtractionReport"]]
+    from_json: ClassVar[Callable[[Union[bytes, str]], "ExtractionReport"]]
+
+
+# ``from_dict`` constructors are generated from the dataclass fields below
+# rather than written by hand and attached to the ``ClassVar`` slots each
+# model declares. Each one is a single ``cls(...)`` call with one
+# ``data.get`` per field, so decoding large reports avoids per-field dispatch.
+# ``from_json`` decodes raw CLI output and builds the model in one step; it is
+# the single place a faster decoding backend plugs in: with msgspec installed
+# it decodes straight into the dataclass in one schema-guided pass, falling
+# back to ``from_dict`` for payloads msgspec rejects. The same per-field
+# expressions also back the lazy views at the end of this module.
+
+
+_ENUM_TABLES: Dict[type, str] = {
+    FailureCode: "_FAILURE_CODES",
+    QualityTier: "_QUALITY_TIERS",
+}
+
+_FIELD_DECODERS: Dict[type, Dict[str, Callable[[Dict[str, Any]], Any]]] = {}
+_TYPED_DECODERS: Dict[type, Any] = {}
+
+
+def _model_name(hint: Any) -> Optional[str]:
+    """Return the class name if *hint* refers to one of the models here."""
+    if isinstance(hint, ForwardRef):
+        hint = globals().get(hint.__forward_arg__)
+    if isinstance(hint, type) and hasattr(hint, "__dataclass_fields__"):
+        return hint.__name__
+    return None
+
+
+def _from_dict_expr(f: Field, hint: Any) -> str:
+    key = repr(f.name)
+    args = get_args(hint)
+
+    if get_origin(hint) is list and args:
+        item = _model_name(args[0])
+        if item is not None:
+            # ``map`` binds the bound method once instead of per element.
+            return f"list(map({item}.from_dict, get({key}, ())))"
+
+    if get_origin(hint) is Union and len(args) == 2 and type(None) in args:
+        inner = args[0] if args[1] is type(None) else args[1]
+        if isinstance(inner, type) and issubclass(inner, Enum):
+            table = _ENUM_TABLES[inner]
+            return (
+                f"({table}.get(v) or {inner.__name__}(v))"
+                f" if (v := get({key})) else None"
+            )
+
+    if hint == ValueType:
+        return f"sys.intern(v) if type(v := get({key}, {f.default!r})) is str else v"
+
+    if f.default_factory is list:
+        return f"get({key}, [])"
+    if f.default is MISSING:
+        raise TypeError(f"field {f.name!r} needs a default to be decoded")
+    return f"get({key}, {f.default!r})"
+
+
+def _compile_from_dict(cls: type) -> None:
+    """Attach a generated ``from_dict`` classmethod to dataclass *cls*.
+
+    Single-field decoders are generated alongside it for the lazy views.
+    """
+    hints = get_type_hints(cls)
+    exprs = {f.name: _from_dict_expr(f, hints[f.name]) for f in fields(cls)}
+    lines = [
+        "def from_dict(cls, data):",
+        "    get = data.get",
+        "    return cls(",
+    ]
+    lines.extend(f"        {name}=({expr})," for name, expr in exprs.items())
+    lines.append("    )")
+    for name, expr in exprs.items():
+        lines.extend(
+            [
+                "",
+                f"def decode_{name}(data):",
+                "    get = data.get",
+                f"    return {expr}",
+            ]
         )
+
+    namespace: Dict[str, Any] = {}
+    code = compile("\n".join(lines), f"<{cls.__name__}.from_dict>", "exec")
+    exec(code, globals(), namespace)
+    cls.from_dict = classmethod(namespace["from_dict"])
+    cls.from_json = classmethod(_from_json)
+    _FIELD_DECODERS[cls] = {name: namespace[f"decode_{name}"] for name in exprs}
+
+
+def _from_json(cls: Any, raw: Union[bytes, str]) -> Any:
+    decoder = _TYPED_DECODERS.get(cls)
+    if decoder is not None:
+        try:
+            return decoder.decode(raw)
+        except _TypedDecodeError:
+            pass  # the lenient path below tolerates it or raises the usual error
+    return cls.from_dict(_json_loads(raw))
+
+
+for _model in (
+    FlagSchema,
+    ArgSchema,
+    SubcommandSchema,
+    CommandSchema,
+    FormatScoreReport,
+    ProbeAttemptReport,
+    ExtractionReport,
+):
+    _compile_from_dict(_model)
+    if _TypedDecoder is not None:
+        _TYPED_DECODERS[_model] = _TypedDecoder(_model)
+del _model
+
+
+class _LazyModel:
+    """Read-only view over decoded JSON that builds fields on first access.
+
+    Decoded fields are cached on the instance, so each is built at most once.
+    """
+
+    _model: ClassVar[type]
+
+    def __init__(self, data: Dict[str, Any]):
+        self._data = data
+
+    def __getattr__(self, name: str) -> Any:
+        decode = _FIELD_DECODERS[self._model].get(name)
+        if decode is None:
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {name!r}"
+            )
+        value = decode(self._data)
+        self.__dict__[name] = value
+        return value
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} of {self._model.__name__}>"
+
+    def materialize(self) -> Any:
+        """Build the full dataclass."""
+        return self._model.from_dict(self._data)
+
+
+class LazyCommandSchema(_LazyModel):
+    """Lazy view of a :class:`CommandSchema`."""
+
+    _model = CommandSchema
+
+
+class LazyExtractionReport(_LazyModel):
+    """Lazy view of an :class:`ExtractionReport`."""
+
+    _model = ExtractionReport